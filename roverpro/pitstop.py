@@ -13,17 +13,23 @@ from roverpro.serial_trio import SerialTrio
 
 BAUDRATE = 57600
 
+# booty bootloader frame telling the power board to launch its application:
+# SOF 0xf7 | payload 01 00 40 (START_APP) | Fletcher-16 checksum 41 43 | EOF 0x7f
+_FIRMWARE_START_FRAME = bytes.fromhex("f701004041437f")
+
 SETTINGS_VERBS = list(map(CommandVerb, [*range(3, 10), *range(11, 19)]))
+SETTINGS_VERBS_SET = frozenset(SETTINGS_VERBS)
 
 
 def rover_command_arg_pair(arg):
     k, v = arg.split(":", 2)
     k = CommandVerb(int(k))
-    if k not in SETTINGS_VERBS:
+    v = int(v)
+    if k not in SETTINGS_VERBS_SET:
         raise ValueError
-    if not 0 <= int(v) <= 255:
+    if not 0 <= v <= 255:
         raise ValueError
-    return k, int(v)
+    return k, v
 
 
 async def amain():
@@ -135,7 +141,7 @@ async def amain():
             orp = RoverProtocol(ser)
             print("instructing rover to restart")
             for i in range(3):
-                orp.write_nowait(0, 0, 0, CommandVerb.RESTART, 0)
+                orp.write_nowait(0, 0, 0, CommandVerb.RESTART, 0, flush=True)
             await orp.flush()
 
         pargs = [
@@ -157,7 +163,7 @@ async def amain():
 
         print("starting firmware")
         async with SerialTrio(port, baudrate=BAUDRATE) as ser:
-            ser.write_nowait(bytes.fromhex("f701004041437f"))
+            ser.write_nowait(_FIRMWARE_START_FRAME)
         print(
             "\n".join(
                 [
@@ -175,11 +181,15 @@ async def amain():
         actual_version = None
         async with SerialTrio(port, baudrate=BAUDRATE) as device:
             orp = RoverProtocol(device)
-            orp.write_nowait(0, 0, 0, CommandVerb.GET_DATA, 40)
+            for _ in range(2):
+                orp.write_nowait(0, 0, 0, CommandVerb.GET_DATA, 40)
+            await orp.flush()
             with trio.move_on_after(10):
-                k, version = await orp.read_one()
-                if k == 40:
-                    actual_version = version
+                for _ in range(2):
+                    k, version = await orp.read_one()
+                    if k == 40:
+                        actual_version = version
+                        break
 
         if actual_version is None:
             print("Could not get version of attached rover")
@@ -196,20 +206,22 @@ async def amain():
                 sys.exit(1)
 
     elif args.action == "config":
-        async with SerialTrio(port, baudrate=57600) as device:
+        async with SerialTrio(port, baudrate=BAUDRATE) as device:
             orp = RoverProtocol(device)
             print("Reloading settings from non-volatile memory.")
-            orp.write_nowait(0, 0, 0, CommandVerb.RELOAD_SETTINGS, 0)
-            for k, v in args.config_items or ():
+            commands = [(0, 0, 0, CommandVerb.RELOAD_SETTINGS, 0)]
+            for k, v in args.config_items:
                 print(f"\tSetting {k.value} ({k.name}) = {v}")
-                orp.write_nowait(0, 0, 0, k, v)
+                commands.append((0, 0, 0, k, v))
             if args.commit:
                 print("These new settings are PERMANENT and will persist on reboot.")
-                orp.write_nowait(0, 0, 0, CommandVerb.COMMIT_SETTINGS, 0)
+                commands.append((0, 0, 0, CommandVerb.COMMIT_SETTINGS, 0))
             else:
                 print("These new settings are TEMPORARY and will be reset on reboot.")
                 print("If you wish for them to persist, please use the --commit option")
-            await orp.flush()
+            with trio.fail_after(1 + 0.01 * len(commands)):
+                orp.write_many_nowait(commands)
+                await orp.flush()
 
     elif args.action == "test":
         argflags = []
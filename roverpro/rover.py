@@ -4,8 +4,7 @@ import trio
 from async_generator import asynccontextmanager
 
 from roverpro.find_device import open_rover_device
-from roverpro.rover_data import ROVER_DATA_ELEMENTS
-from .rover_protocol import CommandVerb, RoverProtocol
+from .rover_protocol import CommandVerb, encode_motor_efforts, RoverProtocol
 from .serial_trio import SerialTrio
 from .util import RoverException
 
@@ -15,9 +14,14 @@ async def open_rover(path_to_serial: Optional[str] = None):
     args = [] if path_to_serial is None else [path_to_serial]
 
     async with open_rover_device(*args) as device:
-        rover = Rover()
-        await rover.set_device(device)
-        yield rover
+        async with trio.open_nursery() as nursery:
+            rover = Rover()
+            await rover.set_device(device)
+            nursery.start_soon(rover._auto_flush_loop)
+            try:
+                yield rover
+            finally:
+                nursery.cancel_scope.cancel()
 
 
 class Rover:
@@ -28,18 +32,26 @@ class Rover:
     _rover_protocol = None
     _device = None
 
-    def __init__(self):
+    def __init__(self, auto_flush_interval: float = 0.002):
+        # how long a coalesced frame may wait before _auto_flush_loop sends it.
+        # The default is about two frame times at 57600 baud.
+        self._auto_flush_interval = auto_flush_interval
         self._motor_left = 0
         self._motor_right = 0
         self._motor_flipper = 0
-        self._rover_data_to_memory_channel = {
-            i: trio.open_memory_channel(0) for i in ROVER_DATA_ELEMENTS.keys()
-        }
+        self._motor_prefix = encode_motor_efforts(0, 0, 0)
 
     async def set_device(self, device: SerialTrio):
         self._device = device
         self._rover_protocol = RoverProtocol(device)
 
+    async def _auto_flush_loop(self):
+        """Bound how long coalesced writes can sit in the protocol buffer"""
+        while True:
+            await trio.sleep(self._auto_flush_interval)
+            if self._rover_protocol.tx_pending:
+                await self._rover_protocol.flush()
+
     def set_motor_speeds(self, left, right, flipper):
         assert -1 <= left <= 1
         assert -1 <= right <= 1
@@ -47,11 +59,10 @@ class Rover:
         self._motor_left = left
         self._motor_right = right
         self._motor_flipper = flipper
+        self._motor_prefix = encode_motor_efforts(left, right, flipper)
 
     def _send_command(self, cmd, arg):
-        self._rover_protocol.write_nowait(
-            self._motor_left, self._motor_right, self._motor_flipper, cmd, arg
-        )
+        self._rover_protocol.write_encoded_tail(self._motor_prefix, cmd, arg)
 
     def send_speed(self):
         self._send_command(CommandVerb.NOP, 0)
@@ -79,24 +90,41 @@ class Rover:
 
         return data
 
-    async def get_data_items(self, indices: Iterable[int]) -> Dict[int, Any]:
-        indices = sorted(set(indices))
-        result = dict.fromkeys(indices)
+    async def get_data_items_stream(
+        self, indices: Iterable[int], timeout: Optional[float] = None
+    ):
+        """Request many data indices at once and yield (index, value) pairs as the
+        responses arrive, so consumers need not wait for the slowest index.
 
-        for index in indices:
-            self._send_command(CommandVerb.GET_DATA, index)
-        for index in indices:
-            with trio.fail_after(1):
-                k, data = await self._rover_protocol.read_one()
-                if k != index:
-                    raise RoverException(
-                        "Received unexpected data. Expected {}, received {}:{}".format(
-                            index, k, data
-                        )
-                    )
-            result[k] = data
+        Raises trio.TooSlowError if not every index is answered within the timeout."""
+        indices = list(indices)
+        if len(indices) != len(set(indices)):
+            indices = sorted(set(indices))
 
-        return result
+        self._rover_protocol.write_many_encoded_tail(
+            self._motor_prefix, ((CommandVerb.GET_DATA, i) for i in indices)
+        )
+        await self._rover_protocol.flush()
+        if timeout is None:
+            timeout = 1 + 0.02 * len(indices)
+        # one absolute deadline for the whole batch, but scoped per read so no
+        # cancel scope stays open across a yield
+        deadline = trio.current_time() + timeout
+        read_one = self._rover_protocol.read_one
+        remaining = set(indices)
+        while remaining:
+            with trio.move_on_at(deadline) as scope:
+                k, data = await read_one()
+            if scope.cancelled_caught:
+                raise trio.TooSlowError
+            if k in remaining:
+                remaining.discard(k)
+                yield k, data
+
+    async def get_data_items(
+        self, indices: Iterable[int], timeout: Optional[float] = None
+    ) -> Dict[int, Any]:
+        return {k: v async for k, v in self.get_data_items_stream(indices, timeout)}
 
 
 async def get_rover_version(port):
@@ -104,8 +132,12 @@ async def get_rover_version(port):
         with trio.fail_after(1):
             async with SerialTrio(port, baudrate=57600) as device:
                 orp = RoverProtocol(device)
+                # pipeline both probes so a lost first frame only costs one
+                # round trip instead of two
                 for i in range(2):
                     orp.write_nowait(0, 0, 0, CommandVerb.GET_DATA, 40)
+                await orp.flush()
+                for i in range(2):
                     k, version = await orp.read_one()
                     if k == 40:
                         return version
@@ -48,13 +48,14 @@ class IntDataFormat(ReadDataFormat, WriteDataFormat):
 
 ROVER_LEGACY_VERSION = 40621
 
+_VERSION_RE = re.compile(r"(\d+(?:[.]\d+){0,2})(?:-([^+])+)?(?:[+](.+))?", re.VERBOSE)
+
 
 @functools.total_ordering
 class RoverFirmwareVersion(NamedTuple):
     @classmethod
     def parse(cls, a_str):
-        ver_re = re.compile(r"(\d+(?:[.]\d+){0,2})(?:-([^+])+)?(?:[+](.+))?", re.VERBOSE)
-        match = ver_re.fullmatch(a_str)
+        match = _VERSION_RE.fullmatch(a_str)
         if match is None:
             raise ValueError
         parts = [int(p) for p in match.group(0).split(".")]
@@ -442,6 +443,11 @@ elements = [
 
 ROVER_DATA_ELEMENTS = {e.index: e for e in elements}
 
+# Decode dispatch table: index -> bound unpack method, built once at import so
+# the per-frame hot path is a dict lookup + call instead of attribute chasing
+# through the element descriptor.
+ROVER_DATA_UNPACK = {e.index: e.data_format.unpack for e in elements}
+
 
 def strike(s):
     return f"~~{s}~~"
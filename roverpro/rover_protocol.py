@@ -1,9 +1,9 @@
 import enum
-from typing import Any, Tuple
+from typing import Any, Iterable, Tuple
 
 import trio
 
-from .rover_data import MOTOR_EFFORT_FORMAT, ROVER_DATA_ELEMENTS
+from .rover_data import MOTOR_EFFORT_FORMAT, ROVER_DATA_UNPACK
 from .serial_trio import SerialTrio
 from .util import RoverException
 
@@ -42,7 +42,23 @@ def encode_packet(*args: bytes):
     return SERIAL_START_BYTE + payload + bytes([checksum(payload)])
 
 
+def encode_motor_efforts(motor_left: float, motor_right: float, flipper: float) -> bytes:
+    """Encode the 3-byte motor effort prefix shared by every outgoing frame.
+
+    Callers that send many commands between speed changes can encode this once
+    and pass it to write_encoded_tail / write_many_encoded_tail."""
+    return (
+        MOTOR_EFFORT_FORMAT.pack(motor_left)
+        + MOTOR_EFFORT_FORMAT.pack(motor_right)
+        + MOTOR_EFFORT_FORMAT.pack(flipper)
+    )
+
+
 def checksum(values):
+    """Additive checksum over the packet payload.
+
+    Deliberately a single builtin sum() call rather than a per-byte Python
+    loop; this runs once per frame on the hot send/receive paths."""
     return 255 - sum(values) % 255
 
 
@@ -52,34 +68,52 @@ class RoverProtocol:
         self._serial = serial
         # A packet involves multiple read operations, so we must lock the device for reading
         self._read_lock = trio.StrictFIFOLock()
+        # Outgoing frames are coalesced here and handed to the serial device in
+        # one write when drained - on flush() or just before reading a response.
+        self._tx = bytearray()
+        # Reusable receive buffer for the frame body (3-byte payload + checksum)
+        self._rx = bytearray(4)
+        self._rx_view = memoryview(self._rx)
+
+    @property
+    def tx_pending(self) -> int:
+        """Number of coalesced outgoing bytes not yet handed to the serial device"""
+        return len(self._tx)
+
+    def _drain_tx(self):
+        if self._tx:
+            self._serial.write_nowait(self._tx)
+            self._tx.clear()
 
     async def read_one(self) -> Tuple[int, Any]:
         raw_data = await self._read_one_raw()
         data_element_index = raw_data[0]
-        element_descriptor = ROVER_DATA_ELEMENTS[data_element_index]
-        data_element_value = element_descriptor.data_format.unpack(raw_data[1:])
+        data_element_value = ROVER_DATA_UNPACK[data_element_index](raw_data[1:])
         return data_element_index, data_element_value
 
     async def _read_one_raw(self) -> bytes:
         """Reads a packet, verifies its checksum, and returns the packet payload"""
         async with self._read_lock:
+            self._drain_tx()
             _ = await self._serial.read_until(SERIAL_START_BYTE)
 
-            payload = await self._serial.read_exactly(3)
+            await self._serial.receive_into(self._rx_view)
 
-            (actual_checksum,) = await self._serial.read_exactly(1)
+            payload = self._rx_view[:3]
+            actual_checksum = self._rx[3]
 
             expected_checksum = checksum(payload)
             if actual_checksum == expected_checksum:
-                return payload
+                return bytes(payload)
             else:
                 raise RoverException(
                     "Bad checksum {}, expected {}. Discarding data {}".format(
-                        list(actual_checksum), list(expected_checksum), list(payload)
+                        actual_checksum, expected_checksum, list(payload)
                     )
                 )
 
     async def flush(self):
+        self._drain_tx()
         await self._serial.flush(0)
 
     def write_nowait(
@@ -89,11 +123,38 @@ class RoverProtocol:
         flipper: float,
         command_verb: CommandVerb,
         command_arg: int,
+        flush: bool = False,
     ):
-        binary = encode_packet(
+        self._tx += encode_packet(
             MOTOR_EFFORT_FORMAT.pack(motor_left),
             MOTOR_EFFORT_FORMAT.pack(motor_right),
             MOTOR_EFFORT_FORMAT.pack(flipper),
             bytes([command_verb, command_arg]),
         )
-        self._serial.write_nowait(binary)
+        if flush:
+            # latency-sensitive commands can opt out of coalescing
+            self._drain_tx()
+
+    def write_many_nowait(self, commands: Iterable[Tuple[float, float, float, CommandVerb, int]]):
+        """Frame many commands and hand them to the serial device as one write.
+
+        Each command is a (motor_left, motor_right, flipper, command_verb, command_arg)
+        tuple as accepted by write_nowait."""
+        for motor_left, motor_right, flipper, command_verb, command_arg in commands:
+            self._tx += encode_packet(
+                MOTOR_EFFORT_FORMAT.pack(motor_left),
+                MOTOR_EFFORT_FORMAT.pack(motor_right),
+                MOTOR_EFFORT_FORMAT.pack(flipper),
+                bytes([command_verb, command_arg]),
+            )
+
+    def write_encoded_tail(self, motor_prefix: bytes, command_verb: CommandVerb, command_arg: int):
+        """Like write_nowait, but with motor efforts already encoded via encode_motor_efforts."""
+        self._tx += encode_packet(motor_prefix, bytes([command_verb, command_arg]))
+
+    def write_many_encoded_tail(
+        self, motor_prefix: bytes, commands: Iterable[Tuple[CommandVerb, int]]
+    ):
+        """Like write_many_nowait, but sharing one pre-encoded motor effort prefix."""
+        for command_verb, command_arg in commands:
+            self._tx += encode_packet(motor_prefix, bytes([command_verb, command_arg]))
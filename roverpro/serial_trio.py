@@ -72,26 +72,48 @@ class SerialTrio(trio.abc.AsyncResource):
             )
         return self._serial.read(n_max)
 
+    def _read_bytes_into_nowait(self, buf):
+        if self._inbound_high_water <= self.in_waiting:
+            warnings.warn(
+                "Incoming buffer is backlogged. Data may be lost. {} bytes".format(
+                    self._serial.in_waiting
+                )
+            )
+        return self._serial.readinto(buf) or 0
+
     async def read_until(self, terminator):
         terminator = bytes(terminator)
         assert terminator != b""
         line = bytearray()
         try:
             while not line.endswith(terminator):
-                line.extend(self._read_bytes_nowait(1))
-                await trio.sleep(0.001)
+                received = self._read_bytes_nowait(1)
+                if received:
+                    line.extend(received)
+                else:
+                    await trio.sleep(0.001)
             return bytes(line)
         except trio.Cancelled:
             logging.exception(f"Abandoning data: {line}")
             self._serial.cancel_read()
             raise
 
+    async def receive_into(self, buf) -> int:
+        """Fill the given writable buffer with incoming bytes and return its length"""
+        view = memoryview(buf)
+        offset = 0
+        while offset < len(view):
+            n = self._read_bytes_into_nowait(view[offset:])
+            if n:
+                offset += n
+            else:
+                await trio.sleep(0.001)
+        return offset
+
     async def read_exactly(self, count):
-        line = bytearray()
-        while len(line) < count:
-            line.extend(self._read_bytes_nowait(count - len(line)))
-            await trio.sleep(0.001)
-        return bytes(line)
+        buf = bytearray(count)
+        await self.receive_into(buf)
+        return bytes(buf)
 
     def write_nowait(self, data):
         self._serial.write(data)
@@ -1,11 +1,27 @@
 import pytest
 import pytest_trio.plugin
 
+from roverpro.find_device import open_rover_device
+from roverpro.util import RoverDeviceNotFound
+
 BOOTLOAD_OPT = "--bootloadok"
 MOTOR_OPT = "--motorok"
 BURNIN_OPT = "--burninok"
 
 
+@pytest.fixture
+async def rover_device():
+    """An open serial device attached to a rover, shared by any test that needs one.
+
+    pytest-trio only supports function-scoped async fixtures (each test gets its
+    own trio run), so the device is reopened per test rather than per module."""
+    try:
+        async with open_rover_device() as device:
+            yield device
+    except RoverDeviceNotFound:
+        pytest.skip("This test requires a rover device but none was found")
+
+
 def pytest_addoption(parser):
     parser.addoption(
         BOOTLOAD_OPT,
@@ -10,16 +10,6 @@ import roverpro
 from roverpro.find_device import open_rover_device
 from roverpro.rover_data import RoverFirmwareVersion
 from roverpro.rover_protocol import CommandVerb, RoverProtocol
-from roverpro.util import RoverDeviceNotFound
-
-
-@pytest.fixture
-async def device():
-    try:
-        async with open_rover_device() as dev:
-            yield dev
-    except RoverDeviceNotFound:
-        pytest.skip("No rover device found")
 
 
 @pytest.fixture
@@ -42,8 +32,8 @@ def booty_exe():
     return p
 
 
-async def test_reboot(device):
-    orp = RoverProtocol(device)
+async def test_reboot(rover_device):
+    orp = RoverProtocol(rover_device)
     try:
         orp.write_nowait(0, 0, 0, CommandVerb.RESTART, 0)
 
@@ -70,7 +60,7 @@ async def test_reboot(device):
 async def test_bootloader(powerboard_firmware_file, booty_exe):
     async with open_rover_device() as device:
         orp = RoverProtocol(device)
-        orp.write_nowait(0, 0, 0, CommandVerb.RESTART, 0)
+        orp.write_nowait(0, 0, 0, CommandVerb.RESTART, 0, flush=True)
         port = device.port
         # flash rover firmware
         args = [
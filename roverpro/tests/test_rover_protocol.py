@@ -1,34 +1,31 @@
 import statistics
+import time
 
 import pytest
 import trio
 
-from roverpro.find_device import open_rover_device
 from roverpro.rover_data import RoverFirmwareVersion
 from roverpro.rover_protocol import CommandVerb, RoverProtocol
-from roverpro.util import RoverDeviceNotFound
 
 n = 100
 
 
 @pytest.fixture
-async def protocol():
-    try:
-        async with open_rover_device() as r:
-            yield RoverProtocol(r)
-    except RoverDeviceNotFound:
-        pytest.skip("This test requires a rover device but none was found")
+async def protocol(rover_device):
+    yield RoverProtocol(rover_device)
 
 
 async def test_rtt(protocol):
     times = []
+    write = protocol.write_nowait
+    flush = protocol.flush
+    read = protocol.read_one
     for _ in range(n):
-        protocol.write_nowait(0, 0, 0, CommandVerb.GET_DATA, 40)
-        await protocol.flush()
-        t0 = trio.current_time()
-        await protocol.read_one()
-        t1 = trio.current_time()
-        times.append(t1 - t0)
+        write(0, 0, 0, CommandVerb.GET_DATA, 40)
+        await flush()
+        t0 = time.perf_counter()
+        await read()
+        times.append(time.perf_counter() - t0)
     assert 0.010 < statistics.mean(times) < 0.030
     assert 0 < statistics.stdev(times) < 0.030
 
@@ -36,10 +33,12 @@ async def test_rtt(protocol):
 async def test_protocol_write_read_immediate(protocol):
     n_received = 0
 
+    write = protocol.write_nowait
+    read = protocol.read_one
     for i in range(n):
-        protocol.write_nowait(0, 0, 0, CommandVerb.GET_DATA, 40)
+        write(0, 0, 0, CommandVerb.GET_DATA, 40)
         with trio.fail_after(1):
-            key, version = await protocol.read_one()
+            key, version = await read()
             assert key == 40
             assert isinstance(version, RoverFirmwareVersion)
             assert isinstance(version.value, int)
@@ -52,8 +51,8 @@ async def test_protocol_write_read_immediate(protocol):
 
 async def test_protocol_writes_then_reads(protocol):
     n_received = 0
-    for _ in range(n):
-        protocol.write_nowait(0, 0, 0, CommandVerb.GET_DATA, 40)
+    protocol.write_many_nowait([(0, 0, 0, CommandVerb.GET_DATA, 40)] * n)
+    await protocol.flush()
     try:
         for i in range(n):
             with trio.fail_after(5):